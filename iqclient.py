@@ -382,7 +382,7 @@ async def run_trade(api, asset, direction, expiry, amount, max_gales=MAX_MARTING
 
         logger.info(f"🎯 Placed trade: {asset} {direction.upper()} ${current_amount} ({expiry}m expiry)")
         pnl_ok, pnl = await api.get_trade_outcome(order_id, expiry=expiry)
-        balance = api.get_current_account_balance()
+        balance = await asyncio.to_thread(api.get_current_account_balance)
 
         if pnl_ok and pnl > 0:
             logger.info(f"✅ WIN on {asset} | Profit: ${pnl:.2f} | Balance: ${balance:.2f}")
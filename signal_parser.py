@@ -4,6 +4,16 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# --- Precompiled Patterns ---
+# Single pass over a raw line: 'O'/'o' typo'd for zero in a time, 'i' used as
+# a separator, and stray whitespace.
+_RE_CLEAN = re.compile(r"(?P<zero>[Oo])(?=\d|\s*:)|(?P<sep>i)|\s+")
+_CLEAN_REPL = {"zero": "0", "sep": ";", None: ""}
+_RE_TOKENS = re.compile(r"(\d{1,2}:\d{2}|[A-Z]{6}|CALL|PUT|\d+)")
+_RE_TIME = re.compile(r"^\d{1,2}:\d{2}$")
+_RE_NONDIGIT = re.compile(r"\D")
+_RE_SIGNAL_TIME = re.compile(r"\d{1,2}:\d{2}")
+
 # --- Core Signal Parsing Logic ---
 def clean_signal_line(line: str) -> str:
     """
@@ -13,17 +23,14 @@ def clean_signal_line(line: str) -> str:
     - Removes extra spaces.
     - Normalizes structure like 00:15;EURUSD;CALL;5
     """
-    # Fix common typos and separators
-    line = line.strip()
-    line = line.replace("i", ";")
-    line = re.sub(r"[Oo](\d)", r"0\1", line)   # O1:05 -> 01:05
-    line = re.sub(r"[Oo]\s*:", "0:", line)     # O :05 -> 0:05
-    line = re.sub(r"\s+", "", line)            # remove stray spaces
+    # Fix common typos and separators in one scan:
+    # O1:05 -> 01:05, O :05 -> 0:05, 'i' -> ';', stray spaces removed
+    line = _RE_CLEAN.sub(lambda m: _CLEAN_REPL[m.lastgroup], line.strip())
 
     # Ensure we have semicolons in right places
     if ";" not in line:
         # Try to guess separator positions (time;pair;direction;amount)
-        parts = re.findall(r"(\d{1,2}:\d{2}|[A-Z]{6}|CALL|PUT|\d+)", line)
+        parts = _RE_TOKENS.findall(line)
         line = ";".join(parts)
 
     return line
@@ -40,21 +47,26 @@ def parse_signal(line: str):
         parts = cleaned.split(";")
 
         if len(parts) < 4:
-            logger.warning(f"Skipping invalid signal format: {line}")
+            logger.warning("Skipping invalid signal format: %s", line)
             return None
 
         time_str = parts[0].strip()
         pair = parts[1].upper().replace("/", "")
         direction = parts[2].upper()
-        expiry = int(re.sub(r"\D", "", parts[3]))  # Extract numeric part safely
+        expiry = int(_RE_NONDIGIT.sub("", parts[3]))  # Extract numeric part safely
 
         # Validate structure
-        if not re.match(r"^\d{1,2}:\d{2}$", time_str):
-            logger.warning(f"Invalid time format: {time_str}")
+        if not _RE_TIME.match(time_str):
+            logger.warning("Invalid time format: %s", time_str)
+            return None
+
+        hh, mm = map(int, time_str.split(":"))
+        if hh > 23 or mm > 59:
+            logger.warning("Invalid time of day: %s", time_str)
             return None
 
         if direction not in ["CALL", "PUT"]:
-            logger.warning(f"Invalid direction: {direction}")
+            logger.warning("Invalid direction: %s", direction)
             return None
 
         return {
@@ -64,7 +76,7 @@ def parse_signal(line: str):
             "expiry": expiry
         }
     except Exception as e:
-        logger.error(f"❌ Failed to parse line '{line}': {e}")
+        logger.error("❌ Failed to parse line '%s': %s", line, e)
         return None
 
 
@@ -75,24 +87,21 @@ def parse_signals_from_text(text: str):
     The text can contain multiple signals in one line.
     """
     signals = []
-    # Split the text by what looks like a time pattern, but keep the delimiter
-    parts = re.split(r'(\d{1,2}:\d{2})', text)
-    
-    # The first part is usually empty or garbage, so skip it.
-    # Then, we have pairs of [time, rest_of_signal]
-    for i in range(1, len(parts), 2):
-        time_str = parts[i]
-        signal_body = parts[i+1]
-        
-        # Reconstruct the signal line
-        line = time_str + signal_body
-        
-        # Now parse the single line
-        sig = parse_signal(line)
+    # Each signal runs from one time match to the next; anything before the
+    # first time is usually empty or garbage and is skipped.
+    start = None
+    for match in _RE_SIGNAL_TIME.finditer(text):
+        if start is not None:
+            sig = parse_signal(text[start:match.start()])
+            if sig:
+                signals.append(sig)
+        start = match.start()
+    if start is not None:
+        sig = parse_signal(text[start:])
         if sig:
             signals.append(sig)
 
-    logger.info(f"✅ Parsed {len(signals)} signals from text input.")
+    logger.info("✅ Parsed %d signals from text input.", len(signals))
     return signals
 
 
@@ -100,16 +109,16 @@ def parse_signals_from_text(text: str):
 def parse_signals_from_file(filepath: str):
     """
     Reads a signal file (usually .txt) and parses all valid signals.
+    Lines are streamed from the file rather than loaded into a list first.
     """
     signals = []
     try:
-        with open(filepath, "r", encoding="utf-8") as f:
-            lines = f.readlines()
-        for line in lines:
-            sig = parse_signal(line)
-            if sig:
-                signals.append(sig)
-        logger.info(f"✅ Parsed {len(signals)} signals from {filepath}.")
+        with open(filepath, "r", encoding="utf-8", errors="replace") as f:
+            for line in f:
+                sig = parse_signal(line)
+                if sig:
+                    signals.append(sig)
+        logger.info("✅ Parsed %d signals from %s.", len(signals), filepath)
     except Exception as e:
-        logger.error(f"❌ Failed to parse signal file: {e}")
+        logger.error("❌ Failed to parse signal file: %s", e)
     return signals
\ No newline at end of file
@@ -4,7 +4,6 @@ import asyncio
 import logging
 import time
 import tempfile
-from datetime import datetime, date, timedelta
 from collections import defaultdict
 from telegram import Update
 from telegram.ext import (
@@ -14,6 +13,7 @@ from telegram.ext import (
 from iqclient import IQOptionAPI, run_trade
 from signal_parser import parse_signals_from_text, parse_signals_from_file
 from settings import DEFAULT_TRADE_AMOUNT
+from utilities import get_schedule_timestamp
 from keep_alive import keep_alive
 
 # --- Logging ---
@@ -57,7 +57,7 @@ async def start(update: Update, context: ContextTypes.DEFAULT_TYPE):
 async def balance(update: Update, context: ContextTypes.DEFAULT_TYPE):
     try:
         await ensure_connection()
-        bal = api.get_current_account_balance()
+        bal = await asyncio.to_thread(api.get_current_account_balance)
         acc_type = getattr(api, "account_mode", "unknown").capitalize()
         await update.message.reply_text(
             f"💼 *{acc_type}* Account\n💰 Balance: *${bal:.2f}*",
@@ -69,7 +69,7 @@ async def balance(update: Update, context: ContextTypes.DEFAULT_TYPE):
 async def refill(update: Update, context: ContextTypes.DEFAULT_TYPE):
     try:
         await ensure_connection()
-        api.refill_practice_balance()
+        await asyncio.to_thread(api.refill_practice_balance)
         await update.message.reply_text("✅ Practice balance refilled!")
     except Exception as e:
         await update.message.reply_text(f"⚠️ Failed to refill balance: {e}")
@@ -77,7 +77,7 @@ async def refill(update: Update, context: ContextTypes.DEFAULT_TYPE):
 async def status(update: Update, context: ContextTypes.DEFAULT_TYPE):
     try:
         await ensure_connection()
-        bal = api.get_current_account_balance()
+        bal = await asyncio.to_thread(api.get_current_account_balance)
         acc_type = getattr(api, "account_mode", "unknown").capitalize()
         connected = getattr(api, "_connected", False)
         uptime_sec = int(time.time() - START_TIME)
@@ -94,7 +94,7 @@ async def status(update: Update, context: ContextTypes.DEFAULT_TYPE):
                     amount = p.get('amount', 0)
                     open_trades.append(f"{asset} ({direction}) @ ${amount}")
         except Exception as e:
-            logger.warning(f"⚠️ Failed to get open positions: {e}")
+            logger.warning("⚠️ Failed to get open positions: %s", e)
 
         trades_info = "\n".join(open_trades) if open_trades else "No open trades."
 
@@ -116,51 +116,53 @@ async def process_and_schedule_signals(update: Update, parsed_signals: list):
         await update.message.reply_text("⚠️ No valid signals found to process.")
         return
 
-    # Convert time strings to datetime objects
+    # Convert time strings to local epoch timestamps; times already past run tomorrow
+    now_ts = time.time()
     for sig in parsed_signals:
         hh, mm = map(int, sig["time"].split(":"))
-        now = datetime.now()
-        sched_time = now.replace(hour=hh, minute=mm, second=0, microsecond=0)
-        if sched_time < now:
-            sched_time += timedelta(days=1)
-        sig["time"] = sched_time
+        sig["time"] = get_schedule_timestamp(hh, mm, now_ts)
 
     # Group signals by scheduled time
     grouped = defaultdict(list)
     for sig in parsed_signals:
         grouped[sig["time"]].append(sig)
 
-    await update.message.reply_text(f"✅ Found {len(parsed_signals)} signals. Scheduling trades...")
-
-    all_trade_tasks = []
-    for sched_time in sorted(grouped.keys()):
-        now = datetime.now()
-        delay = (sched_time - now).total_seconds()
+    async def notify(msg):
+        try:
+            await update.message.reply_text(msg)
+        except Exception as e:
+            logger.error(f"Failed to send notification: {e}")
 
+    async def run_group(sched_time, group):
+        delay = sched_time - time.time()
         if delay > 0:
-            msg = f"⏳ Waiting {int(delay)}s until {sched_time.strftime('%H:%M')} for {len(grouped[sched_time])} signal(s)..."
-            logger.info(msg)
-            await update.message.reply_text(msg)
             await asyncio.sleep(delay)
 
-        exec_msg = f"🚀 Executing {len(grouped[sched_time])} signal(s) at {sched_time.strftime('%H:%M')}"
-        logger.info(exec_msg)
-        await update.message.reply_text(exec_msg)
-
-        async def notify(msg):
-            try:
-                await update.message.reply_text(msg)
-            except Exception as e:
-                logger.error(f"Failed to send notification: {e}")
-
-        for s in grouped[sched_time]:
-            task = asyncio.create_task(run_trade(api, s["pair"], s["direction"], s["expiry"], DEFAULT_TRADE_AMOUNT, notification_callback=notify))
-            all_trade_tasks.append(task)
+        trade_tasks = [
+            asyncio.create_task(run_trade(api, s["pair"], s["direction"], s["expiry"], DEFAULT_TRADE_AMOUNT, notification_callback=notify))
+            for s in group
+        ]
+        logger.info(f"🚀 Executing {len(group)} signal(s) at {time.strftime('%H:%M', time.localtime(sched_time))}")
+        return await asyncio.gather(*trade_tasks)
+
+    # Every group sleeps towards its own deadline concurrently
+    group_tasks = [
+        asyncio.create_task(run_group(sched_time, grouped[sched_time]))
+        for sched_time in sorted(grouped.keys())
+    ]
+
+    # One status message for the whole batch instead of one per group
+    schedule = "\n".join(
+        f"• {time.strftime('%H:%M', time.localtime(sched_time))} ({len(grouped[sched_time])})"
+        for sched_time in sorted(grouped.keys())
+    )
+    logger.info(f"Scheduled {len(parsed_signals)} signals in {len(grouped)} group(s)")
+    await update.message.reply_text(f"✅ Found {len(parsed_signals)} signals. Scheduled trades:\n{schedule}")
 
     # Wait for all trades to complete and generate report
-    if all_trade_tasks:
-        results = await asyncio.gather(*all_trade_tasks)
-        
+    if group_tasks:
+        results = [res for group_results in await asyncio.gather(*group_tasks) for res in group_results]
+
         report_lines = ["📊 *Trade Session Report*"]
         total_profit = 0.0
         wins = 0
@@ -224,7 +226,8 @@ async def notify_admin_startup(app):
             return
 
         # Connection is now handled in post_init before this is called.
-        bal = api.get_current_account_balance()
+        # The balance request blocks until the reply arrives, so keep it off the loop.
+        bal = await asyncio.to_thread(api.get_current_account_balance)
         acc_type = getattr(api, "account_mode", "unknown").capitalize()
 
         message = (
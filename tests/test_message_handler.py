@@ -0,0 +1,87 @@
+# tests/test_message_handler.py
+import unittest
+import json
+import time
+import tempfile
+import sys
+import os
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from wsmanager.message_handler import MessageHandler, _dump_line
+
+
+def position_changed(order_id, **fields):
+    return {"name": "position-changed", "msg": {"raw_event": {"order_ids": [order_id]}, **fields}}
+
+
+def option_closed(option_id, **fields):
+    return {"name": "option-closed", "msg": {"id": option_id, **fields}}
+
+
+class TestPositionLog(unittest.TestCase):
+
+    def setUp(self):
+        # The writer thread appends to '<name>.ndjson' in the working directory
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.addCleanup(os.chdir, os.getcwd())
+        os.chdir(tmpdir.name)
+        self.handler = MessageHandler()
+
+    def wait_for_lines(self, filename, count, timeout=2):
+        """Reads the log once the writer thread has appended `count` lines."""
+        deadline = time.time() + timeout
+        while time.time() < deadline:
+            if os.path.exists(filename):
+                with open(filename, "rb") as f:
+                    lines = f.read().splitlines(keepends=True)
+                if len(lines) >= count:
+                    return lines
+            time.sleep(0.01)
+        self.fail(f"{filename} did not reach {count} line(s)")
+
+    def test_messages_are_appended_as_compact_lines(self):
+        """Tests that position-changed and option-closed each append one compact line to their log."""
+        self.handler.handle_message(position_changed(1, status="open"))
+        self.handler.handle_message(position_changed(1, status="closed", pnl=1.5))
+        self.handler.handle_message(option_closed(7, pnl=-1))
+
+        positions = self.wait_for_lines("positions.ndjson", 2)
+        binary = self.wait_for_lines("binary_positions.ndjson", 1)
+
+        self.assertEqual(positions, [
+            b'{"raw_event":{"order_ids":[1]},"status":"open"}\n',
+            b'{"raw_event":{"order_ids":[1]},"status":"closed","pnl":1.5}\n',
+        ])
+        self.assertEqual(binary, [b'{"id":7,"pnl":-1}\n'])
+
+    def test_unserializable_message_is_logged_and_skipped(self):
+        """Tests that a message that cannot be encoded is logged and later messages are still written."""
+        with self.assertLogs("wsmanager.message_handler", level="ERROR") as logs:
+            self.handler.handle_message(option_closed(1, bad=object()))
+            self.handler.handle_message(option_closed(2))
+            lines = self.wait_for_lines("binary_positions.ndjson", 1)
+
+        self.assertEqual([json.loads(line) for line in lines], [{"id": 2}])
+        self.assertIn("binary_positions.ndjson", logs.output[0])
+        self.assertTrue(self.handler._save_thread.is_alive())
+
+
+class TestDumpLine(unittest.TestCase):
+
+    def test_compact_line(self):
+        """Tests that a message is encoded as one compact, newline-terminated line."""
+        self.assertEqual(_dump_line({"id": 1, "pnl": 1.5}), b'{"id":1,"pnl":1.5}\n')
+
+    def test_integer_beyond_64_bits(self):
+        """Tests that integers orjson rejects fall back to the stdlib encoder."""
+        line = _dump_line({"big": 2**70})
+
+        self.assertTrue(line.endswith(b"\n"))
+        self.assertEqual(line.count(b"\n"), 1)
+        self.assertEqual(json.loads(line), {"big": 2**70})
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,11 +2,12 @@
 import unittest
 import sys
 import os
+import tempfile
 
 # Add the project root to the Python path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from signal_parser import parse_signal
+from signal_parser import parse_signal, parse_signals_from_file, parse_signals_from_text
 
 class TestSignalParser(unittest.TestCase):
 
@@ -43,6 +44,23 @@ class TestSignalParser(unittest.TestCase):
         }
         self.assertEqual(parse_signal(line), expected)
 
+    def test_signal_with_spaced_o_before_colon(self):
+        """Tests an 'O' separated from the colon by spaces, with 'i' separators."""
+        line = "1O : 30 i USDCAD i CALL i 5"
+        expected = {
+            "time": "10:30",
+            "pair": "USDCAD",
+            "direction": "CALL",
+            "expiry": 5
+        }
+        self.assertEqual(parse_signal(line), expected)
+
+    def test_signal_with_out_of_range_time(self):
+        """Tests that times matching HH:MM but not a real time of day are rejected."""
+        for line in ("25:30;EURUSD;CALL;5", "12:60;EURUSD;CALL;5", "99:99;EURUSD;PUT;1"):
+            with self.subTest(line=line), self.assertLogs("signal_parser", level="WARNING"):
+                self.assertIsNone(parse_signal(line))
+
     def test_invalid_signal_format(self):
         """Tests a line that is not a valid signal and should return None."""
         line = "this is not a signal"
@@ -58,5 +76,27 @@ class TestSignalParser(unittest.TestCase):
         line = "11:30;EURCAD;CALL"
         self.assertIsNone(parse_signal(line))
 
+    def test_parse_signals_from_text_with_several_per_line(self):
+        """Tests that a pasted blob is split into one signal per time."""
+        text = "junk 09:15;EURUSD;CALL;5 10:30 i USDJPY i PUT i 1\n11:00;BAD"
+        signals = parse_signals_from_text(text)
+        self.assertEqual([(s["time"], s["pair"], s["direction"], s["expiry"]) for s in signals], [
+            ("09:15", "EURUSD", "CALL", 5),
+            ("10:30", "USDJPY", "PUT", 1),
+        ])
+
+    def test_parse_signals_from_file(self):
+        """Tests that every valid line of a signal file is parsed and invalid ones skipped."""
+        content = "09:15;EURUSD;CALL;5\nnot a signal\n O8:O5 i GBPUSD i PUT i 1\n"
+        with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False, encoding="utf-8") as f:
+            f.write(content)
+        self.addCleanup(os.remove, f.name)
+
+        signals = parse_signals_from_file(f.name)
+        self.assertEqual([(s["time"], s["pair"], s["direction"], s["expiry"]) for s in signals], [
+            ("09:15", "EURUSD", "CALL", 5),
+            ("08:05", "GBPUSD", "PUT", 1),
+        ])
+
 if __name__ == '__main__':
     unittest.main()
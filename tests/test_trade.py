@@ -0,0 +1,172 @@
+# tests/test_trade.py
+import unittest
+import asyncio
+import threading
+import sys
+import os
+from datetime import datetime, timezone
+from unittest import mock
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from trade import TradeManager
+from utilities import get_expiration
+from wsmanager.message_handler import MessageHandler
+
+# 2023-09-04 16:00:15 UTC, in milliseconds like the server's timeSync
+SERVER_TIME = 1693843215000
+
+
+class StubAccountManager:
+    current_account_id = 123
+
+
+class StubWebSocketManager:
+    """Records sent messages and answers them from another thread, like the real socket."""
+
+    def __init__(self, message_handler, reply=None):
+        self.message_handler = message_handler
+        self.reply = reply
+        self.sent = []
+
+    def send_message(self, name, msg, request_id=""):
+        self.sent.append((name, msg, request_id))
+        if self.reply is not None:
+            self.respond(self.reply(request_id))
+        return request_id
+
+    def respond(self, *messages):
+        def deliver():
+            for message in messages:
+                self.message_handler.handle_message(message)
+        thread = threading.Thread(target=deliver)
+        thread.start()
+        thread.join()
+
+
+def placed(order_id=None, error=None):
+    def reply(request_id):
+        msg = {"id": order_id} if order_id is not None else {"message": error}
+        return {"name": "digital-option-placed", "request_id": request_id, "msg": msg}
+    return reply
+
+
+def position_closed(order_id, pnl):
+    return {
+        "name": "position-changed",
+        "msg": {"status": "closed", "pnl": pnl, "raw_event": {"order_ids": [order_id]}},
+    }
+
+
+class TestTradeManager(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        # Keep the position log writer from touching the disk
+        patcher = mock.patch.object(MessageHandler, "_save_data")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.handler = MessageHandler()
+        self.handler.server_time = SERVER_TIME
+        self.ws = StubWebSocketManager(self.handler)
+        self.manager = TradeManager(self.ws, self.handler, StubAccountManager())
+
+    async def test_order_confirmed_from_websocket_thread(self):
+        """Tests that a placement reply delivered on another thread resolves the waiting trade."""
+        self.ws.reply = placed(order_id=777)
+
+        result = await self.manager._execute_digital_option_trade("EURUSD-op", 1, "CALL", 1)
+
+        self.assertEqual(result, (True, 777))
+        self.assertEqual(self.handler._digital_futures, {})
+
+    async def test_order_body_matches_wire_format(self):
+        """Tests that the order body and instrument id keep their original format."""
+        self.ws.reply = placed(order_id=777)
+
+        await self.manager._execute_digital_option_trade("EURUSD-op", 1, "call", 1)
+
+        name, msg, request_id = self.ws.sent[0]
+        date_formatted = datetime.fromtimestamp(get_expiration(SERVER_TIME, 1), timezone.utc).strftime("%Y%m%d%H%M")
+        self.assertEqual(name, "sendMessage")
+        self.assertIsInstance(request_id, str)
+        self.assertEqual(msg, {
+            "name": "digital-options.place-digital-option",
+            "version": "3.0",
+            "body": {
+                "user_balance_id": 123,
+                "instrument_id": f"do1861A{date_formatted[:8]}D{date_formatted[8:]}00T1MCSPT",
+                "amount": "1",
+                "asset_id": 1861,
+                "instrument_index": 0,
+            }
+        })
+        self.assertEqual(msg["body"]["instrument_id"], "do1861A20230904D160100T1MCSPT")
+
+    async def test_order_rejected(self):
+        """Tests that a placement error message is returned as a failed order."""
+        self.ws.reply = placed(error="Not enough money")
+
+        with self.assertLogs("trade", level="ERROR"):
+            result = await self.manager._execute_digital_option_trade("EURUSD-op", 1, "put", 1)
+
+        self.assertEqual(result, (False, "Not enough money"))
+        self.assertEqual(self.handler._digital_futures, {})
+
+    async def test_reply_arrived_before_waiting(self):
+        """Tests that a reply stored before the waiter registered is still picked up."""
+        self.ws.respond(placed(order_id=555)("42"))
+
+        result = await self.manager.wait_for_order_confirmation(42, 1, timeout=1)
+
+        self.assertEqual(result, (True, 555))
+        self.assertEqual(self.handler._digital_futures, {})
+
+    async def test_order_confirmation_timeout(self):
+        """Tests that an unanswered order times out with None and leaves no future behind."""
+        with self.assertLogs("trade", level="ERROR"):
+            result = await self.manager.wait_for_order_confirmation(99, 1, timeout=0.05)
+
+        self.assertIsNone(result)
+        self.assertEqual(self.handler._digital_futures, {})
+
+    async def test_failed_send_discards_future(self):
+        """Tests that an exception while sending does not leak the registered future."""
+        with mock.patch.object(self.ws, "send_message", side_effect=ConnectionError("closed")):
+            with self.assertLogs("trade", level="ERROR"):
+                result = await self.manager._execute_digital_option_trade("EURUSD-op", 1, "call", 1)
+
+        self.assertIsNone(result)
+        self.assertEqual(self.handler._digital_futures, {})
+
+    async def test_trade_outcome_from_websocket_thread(self):
+        """Tests that a closed position delivered on another thread resolves the outcome."""
+        loop = asyncio.get_running_loop()
+        loop.call_later(0.05, self.ws.respond, position_closed(777, 1.5))
+
+        result = await self.manager.get_trade_outcome(777, 1)
+
+        self.assertEqual(result, (True, 1.5))
+        self.assertEqual(self.handler._outcome_futures, {})
+
+    async def test_trade_outcome_already_closed(self):
+        """Tests that a position closed before the outcome is requested is returned at once."""
+        self.ws.respond(position_closed(777, -1))
+
+        result = await self.manager.get_trade_outcome(777, 1)
+
+        self.assertEqual(result, (True, -1))
+        self.assertEqual(self.handler._outcome_futures, {})
+
+    async def test_trade_outcome_timeout(self):
+        """Tests that a position that never closes returns (False, None) and leaves no future behind."""
+        # get_trade_outcome waits remaining seconds + 3
+        with mock.patch("trade.get_remaining_secs", return_value=-2.95):
+            result = await self.manager.get_trade_outcome(777, 1)
+
+        self.assertEqual(result, (False, None))
+        self.assertEqual(self.handler._outcome_futures, {})
+
+if __name__ == '__main__':
+    unittest.main()
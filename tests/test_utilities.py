@@ -0,0 +1,46 @@
+# tests/test_utilities.py
+import unittest
+import time
+import sys
+import os
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from utilities import get_schedule_timestamp
+
+# 2024-03-10 12:00:00 local time
+NOW_TS = time.mktime((2024, 3, 10, 12, 0, 0, 0, 0, -1))
+
+
+class TestGetScheduleTimestamp(unittest.TestCase):
+
+    def test_later_time_is_scheduled_today(self):
+        """Tests that a time still ahead of now is scheduled the same day."""
+        sched = time.localtime(get_schedule_timestamp(13, 30, NOW_TS))
+        self.assertEqual(sched[:6], (2024, 3, 10, 13, 30, 0))
+
+    def test_current_minute_is_scheduled_today(self):
+        """Tests that the current minute is not pushed to the next day."""
+        self.assertEqual(get_schedule_timestamp(12, 0, NOW_TS), NOW_TS)
+
+    def test_past_time_rolls_to_next_day(self):
+        """Tests that a past time moves to the next day at the same wall-clock time."""
+        sched = time.localtime(get_schedule_timestamp(9, 15, NOW_TS))
+        self.assertEqual(sched[:6], (2024, 3, 11, 9, 15, 0))
+
+    def test_past_time_rolls_past_month_end(self):
+        """Tests that rolling over on the last day of a month lands on the 1st."""
+        now_ts = time.mktime((2024, 3, 31, 23, 50, 0, 0, 0, -1))
+        sched = time.localtime(get_schedule_timestamp(0, 5, now_ts))
+        self.assertEqual(sched[:6], (2024, 4, 1, 0, 5, 0))
+
+    def test_out_of_range_time_raises(self):
+        """Tests that out-of-range times raise instead of being normalized into another day."""
+        for hour, minute in ((24, 0), (12, 60), (99, 99)):
+            with self.subTest(hour=hour, minute=minute):
+                with self.assertRaises(ValueError):
+                    get_schedule_timestamp(hour, minute, NOW_TS)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,12 +1,17 @@
-import asyncio
 import time
+import asyncio
 import logging
-from datetime import datetime, timezone
+from itertools import count
 from options_assests import UNDERLYING_ASSESTS
 from utilities import get_expiration, get_remaining_secs
 
 logger = logging.getLogger(__name__)
 
+# Request ids for order placement, unique for the lifetime of the process
+_REQ_ID = count(1)
+
+_DIRECTIONS = frozenset(('put', 'call'))
+
 
 # Custom exceptions for better error categorization
 class TradeExecutionError(Exception):
@@ -30,26 +35,33 @@ class TradeManager:
         self.ws_manager = websocket_manager
         self.message_handler = message_handler
         self.account_manager = account_manager
+        # (asset_id, expiration, expiry, direction) -> instrument_id of the last order
+        self._last_instrument = (None, None)
 
     def get_asset_id(self, asset_name: str) -> int:
-        if asset_name in UNDERLYING_ASSESTS:
-            return UNDERLYING_ASSESTS[asset_name]
-        raise KeyError(f'{asset_name} not found!')
+        asset_id = UNDERLYING_ASSESTS.get(asset_name)
+        if asset_id is None:
+            raise KeyError(f'{asset_name} not found!')
+        return asset_id
 
     # ========== DIGITAL OPTIONS ==========
     async def _execute_digital_option_trade(self, asset:str, amount:float, direction:str, expiry:int=1):
         try:
             direction = direction.lower()
             self._validate_options_trading_parameters(asset, amount, direction, expiry)
+            direction_code = 'C' if direction == 'call' else 'P'
 
-            direction_map = {'put': 'P', 'call': 'C'}        
-            direction_code = direction_map[direction]
-
-            from random import randint
-            request_id = str(randint(0, 100000))
+            request_id = next(_REQ_ID)
 
             msg = self._build_options_body(asset, amount, expiry, direction_code)
-            self.ws_manager.send_message("sendMessage", msg, request_id)
+            # Register before sending so a fast reply cannot be missed
+            futures = self.message_handler._digital_futures
+            futures[request_id] = asyncio.get_running_loop().create_future()
+            try:
+                self.ws_manager.send_message("sendMessage", msg, str(request_id))
+            except Exception:
+                futures.pop(request_id, None)
+                raise
 
             return await self.wait_for_order_confirmation(request_id, expiry)
             
@@ -59,48 +71,62 @@ class TradeManager:
             logger.error(f"Unexpected error during trade execution: {e}", exc_info=True)
 
     async def wait_for_order_confirmation(self, request_id:int, expiry:int, timeout:int=10):
-        start_time = time.time()
-        while time.time() - start_time < timeout:
-            result = self.message_handler.open_positions['digital_options'].get(request_id)
-            if result is not None:
-                if isinstance(result, int):
-                    expires_in = get_remaining_secs(self.message_handler.server_time, expiry)
-                    logger.info(f'Order Executed Successfully, Order ID: {result}, Expires in: {expires_in} Seconds')
-                    return True, result
-                else:
-                    logger.error(f'Order Execution Failed, Reason: !!! {result} !!!')
-                    return False, result
-            await asyncio.sleep(0.1)
-                
-        logger.error(f"Order Confirmation timed out after {timeout} seconds")
+        futures = self.message_handler._digital_futures
+        future = futures.get(request_id)
+        if future is None:
+            future = futures[request_id] = asyncio.get_running_loop().create_future()
+        try:
+            # The reply may have landed before the future was registered
+            result = self.message_handler.digital_open.get(request_id)
+            if result is None:
+                result = await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            logger.error(f"Order Confirmation timed out after {timeout} seconds")
+            return
+        finally:
+            futures.pop(request_id, None)
+
+        if isinstance(result, int):
+            expires_in = get_remaining_secs(self.message_handler.server_time, expiry)
+            logger.info(f'Order Executed Successfully, Order ID: {result}, Expires in: {expires_in} Seconds')
+            return True, result
+        else:
+            logger.error(f'Order Execution Failed, Reason: !!! {result} !!!')
+            return False, result
 
     def _build_options_body(self, asset: str, amount: float, expiry: int, direction: str) -> str:
-        active_id = str(self.get_asset_id(asset))
+        active_id = self.get_asset_id(asset)
         expiration = get_expiration(self.message_handler.server_time, expiry)
-        date_formatted = datetime.fromtimestamp(expiration, timezone.utc).strftime("%Y%m%d%H%M")
 
-        instrument_id = f"do{active_id}A{date_formatted[:8]}D{date_formatted[8:]}00T{expiry}M{direction}SPT"
+        # Orders for the same contract within a minute share the instrument id
+        key = (active_id, expiration, expiry, direction)
+        cached_key, instrument_id = self._last_instrument
+        if cached_key != key:
+            t = time.gmtime(expiration)
+            instrument_id = (f"do{active_id}A{t.tm_year:04d}{t.tm_mon:02d}{t.tm_mday:02d}"
+                             f"D{t.tm_hour:02d}{t.tm_min:02d}00T{expiry}M{direction}SPT")
+            self._last_instrument = (key, instrument_id)
 
         return {
             "name": "digital-options.place-digital-option",
             "version": "3.0",
             "body": {
                 "user_balance_id": int(self.account_manager.current_account_id),
-                "instrument_id": str(instrument_id),
+                "instrument_id": instrument_id,
                 "amount": str(amount),
-                "asset_id": int(active_id),
+                "asset_id": active_id,
                 "instrument_index": 0,
             }
         }
     
     # ========== PARAM VALIDATION ==========
     def _validate_options_trading_parameters(self, asset: str, amount: float, direction: str, expiry: int) -> None:
+        # direction is expected already lower-cased by the caller
         if not isinstance(asset, str) or not asset.strip():
             raise InvalidTradeParametersError("Asset name cannot be empty")
         if not isinstance(amount, (int, float)) or amount < 1:
             raise InvalidTradeParametersError(f"Minimum Bet Amount is $1, got: {amount}")
-        direction = direction.lower().strip()
-        if direction not in ['put', 'call']:
+        if direction not in _DIRECTIONS:
             raise InvalidTradeParametersError(f"Direction must be 'put' or 'call', got: {direction}")
         if not isinstance(expiry, int) or expiry < 1:
             raise InvalidTradeParametersError(f"Expiry must be positive integer, got: {expiry}")
@@ -109,16 +135,21 @@ class TradeManager:
             
     # ========== TRADE OUTCOME ==========
     async def get_trade_outcome(self, order_id: int, expiry:int=1):
-        start_time = time.time()
         timeout = get_remaining_secs(self.message_handler.server_time, expiry)
 
-        while time.time() - start_time < timeout + 3:
+        futures = self.message_handler._outcome_futures
+        future = futures[order_id] = asyncio.get_running_loop().create_future()
+        try:
+            # The position may have closed before the future was registered
             order_data = self.message_handler.position_info.get(order_id, {})
-            if order_data and order_data.get("status") == "closed":
-                pnl = order_data.get('pnl', 0)
-                result_type = "WIN" if pnl > 0 else "LOSS"
-                logger.info(f"Trade closed - Order ID: {order_id}, Result: {result_type}, PnL: ${pnl:.2f}")
-                return True, pnl
-            await asyncio.sleep(.5)
-
-        return False, None
+            if not (order_data and order_data.get("status") == "closed"):
+                order_data = await asyncio.wait_for(future, timeout + 3)
+        except asyncio.TimeoutError:
+            return False, None
+        finally:
+            futures.pop(order_id, None)
+
+        pnl = order_data.get('pnl', 0)
+        result_type = "WIN" if pnl > 0 else "LOSS"
+        logger.info(f"Trade closed - Order ID: {order_id}, Result: {result_type}, PnL: ${pnl:.2f}")
+        return True, pnl
@@ -1,5 +1,7 @@
 # utilities.py
+import time
 import logging
+from functools import lru_cache
 from datetime import datetime, timedelta
 
 logger = logging.getLogger(__name__)
@@ -43,6 +45,7 @@ def get_timestamps(start_str: str = None, end_str: str = None) -> tuple:
         return None, None
 
 
+@lru_cache(maxsize=1024)
 def get_expiration(timestamp:int, expiry:int=1):
     """
     Calculate expiration timestamp based on a given timestamp and expiry duration.
@@ -58,6 +61,8 @@ def get_expiration(timestamp:int, expiry:int=1):
         - The function ensures a minimum of 31 seconds between the current time
           and expiration to prevent immediate expiry.
         - Input timestamp is expected in milliseconds but output is in seconds.
+        - Results are memoized; the server time only changes on each timeSync,
+          so trades placed between syncs share one computation.
     
     Example:
         >>> get_expiration(1693843200000, 5)  # 5-minute expiry
@@ -95,6 +100,7 @@ def get_expiration(timestamp:int, expiry:int=1):
     return expiration.timestamp()
 
 
+@lru_cache(maxsize=1024)
 def get_remaining_secs(timestamp, duration):
     """
     Calculate the remaining seconds until expiration for a given duration.
@@ -116,4 +122,32 @@ def get_remaining_secs(timestamp, duration):
     expiry_ts = get_expiration(timestamp, duration)
 
     # Calculate remaining seconds by subtracting current time from expiration time
-    return expiry_ts - int(timestamp/1000)
\ No newline at end of file
+    return expiry_ts - int(timestamp/1000)
+
+
+def get_schedule_timestamp(hour: int, minute: int, now_ts: float) -> float:
+    """
+    Get the local epoch timestamp of the next HH:MM at or after a given time.
+    
+    Args:
+        hour (int): Hour of day, 0-23.
+        minute (int): Minute, 0-59.
+        now_ts (float): Reference time in seconds since epoch.
+    
+    Returns:
+        float: Timestamp of HH:MM today, or tomorrow at the same wall-clock
+               time if that has already passed.
+    
+    Raises:
+        ValueError: If hour or minute is out of range. time.mktime would
+                    otherwise silently roll e.g. 99:99 into a later day.
+    """
+    if not (0 <= hour <= 23 and 0 <= minute <= 59):
+        raise ValueError(f'Invalid time of day: {hour:02d}:{minute:02d}')
+
+    year, month, day = time.localtime(now_ts)[:3]
+    sched_ts = time.mktime((year, month, day, hour, minute, 0, 0, 0, -1))
+    if sched_ts < now_ts:
+        # mktime normalizes day + 1, keeping the wall-clock time across DST changes
+        sched_ts = time.mktime((year, month, day + 1, hour, minute, 0, 0, 0, -1))
+    return sched_ts
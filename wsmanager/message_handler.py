@@ -1,8 +1,48 @@
 import json
+import queue
 import logging
+import threading
+
+try:
+    import orjson
+except ImportError:  # optional speed-up, fall back to the stdlib encoder
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
+
+def _dump_line(message) -> bytes:
+    """Serialize a message as one compact JSON line."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(message, option=orjson.OPT_APPEND_NEWLINE)
+        except TypeError:
+            pass  # e.g. ints beyond 64 bits, which the stdlib encoder accepts
+    return json.dumps(message, separators=(',', ':')).encode() + b'\n'
+
+
+def _request_key(request_id):
+    """Int key for the numeric ids we send; anything else (e.g. the empty id
+    on server-pushed events) is kept as-is."""
+    return int(request_id) if str(request_id).isdigit() else request_id
+
+
+def _set_future_result(future, result):
+    if not future.done():
+        future.set_result(result)
+
+
+def _resolve_future(futures, key, result):
+    """Hand a result to the coroutine awaiting `key`, if any.
+
+    Handlers run on the websocket thread, so the future is completed on
+    its own event loop.
+    """
+    future = futures.pop(key, None)
+    if future is not None:
+        future.get_loop().call_soon_threadsafe(_set_future_result, future, result)
+
+
 class MessageHandler:
     def __init__(self):
         self.server_time = None
@@ -13,34 +53,38 @@ class MessageHandler:
         self.initialization_data = None
         self._underlying_assests = None
         self.hisory_positions = None
-        self.open_positions = {
-            'digital_options': {},
-            'binary_options': {}
-        }
+        # Placement results keyed by request_id: order id, or error message
+        self.digital_open = {}
+        self.binary_open = {}
         self.position_info = {}
+        # Futures awaited by TradeManager, keyed by int request_id / order id
+        self._digital_futures = {}
+        self._outcome_futures = {}
+        self._save_queue = queue.SimpleQueue()
+        self._save_thread = None
+
+    @property
+    def open_positions(self):
+        """Both placement tables under their former nested keys."""
+        return {
+            'digital_options': self.digital_open,
+            'binary_options': self.binary_open,
+        }
 
     def handle_message(self, message):
-        message_name = message.get('name')
-        handlers = {
-            'profile': self._handle_profile,
-            'candles': self._handle_candles,
-            'balances': self._handle_balances,
-            'timeSync': self._handle_server_time,
-            'underlying-list': self._handle_underlying_list,
-            'initialization-data': self._handle_initialization_data,
-            'training-balance-reset': self._handle_training_balance_reset,
-            "history-positions": self._handle_position_history,
-            "digital-option-placed": self._handle_digital_option_placed,
-            "position-changed": self._handle_position_changed,
-            "option-opened": self._handle_binary_option_opened,
-            "option-closed": self._handle_binary_option_closed,
-        }
-        handler = handlers.get(message_name)
-        if handler:
-            handler(message)
+        name = message.get('name')
+
+        # The highest-frequency messages are single stores, handled inline
+        if name == 'timeSync':
+            self.server_time = message['msg']
+            return
+        if name == 'candles':
+            self.candles = message['msg']['candles']
+            return
 
-    def _handle_server_time(self, message):
-        self.server_time = message['msg']
+        handler = self._HANDLERS.get(name)
+        if handler:
+            handler(self, message)
 
     def _handle_profile(self, message):
         self.profile_msg = message
@@ -64,9 +108,6 @@ class MessageHandler:
     def _handle_initialization_data(self, message):
         self._underlying_assests = message['msg']
 
-    def _handle_candles(self, message):
-        self.candles = message['msg']['candles']
-
     def _handle_underlying_list(self, message):
         if message['msg'].get('type', None) == 'digital-option':
             self._underlying_assests = message['msg']['underlying']
@@ -78,28 +119,84 @@ class MessageHandler:
 
     def _handle_digital_option_placed(self, message):
         if message["msg"].get("id") is not None:
-            self.open_positions['digital_options'][message["request_id"]] = message["msg"].get("id")
+            result = message["msg"].get("id")
         else:
-            self.open_positions['digital_options'][message["request_id"]] = message["msg"].get("message")
+            result = message["msg"].get("message")
+        request_id = _request_key(message.get("request_id"))
+        self.digital_open[request_id] = result
+        _resolve_future(self._digital_futures, request_id, result)
 
     def _handle_position_changed(self, message):
-        self.position_info[int(message["msg"]["raw_event"]["order_ids"][0])] = message['msg']
+        order_id = int(message["msg"]["raw_event"]["order_ids"][0])
+        self.position_info[order_id] = message['msg']
+        if message['msg'].get("status") == "closed":
+            _resolve_future(self._outcome_futures, order_id, message['msg'])
         self._save_data(message['msg'], 'positions')
 
     # ================= BINARY HANDLERS =================
     def _handle_binary_option_opened(self, message):
         option_id = message["msg"].get("id")
+        request_id = _request_key(message.get("request_id"))
         if option_id:
-            self.open_positions['binary_options'][message["request_id"]] = option_id
+            self.binary_open[request_id] = option_id
         else:
-            self.open_positions['binary_options'][message["request_id"]] = message["msg"].get("message")
+            self.binary_open[request_id] = message["msg"].get("message")
 
     def _handle_binary_option_closed(self, message):
         option_id = int(message["msg"]["id"])
         self.position_info[option_id] = message["msg"]
+        if message["msg"].get("status") == "closed":
+            _resolve_future(self._outcome_futures, option_id, message["msg"])
         self._save_data(message['msg'], 'binary_positions')
 
     # Utility
     def _save_data(self, message, filename):
-        with open(f'{filename}.json', 'w') as file:
-            json.dump(message, file, indent=4)
+        # Disk I/O happens on a daemon writer thread so the websocket
+        # callback never blocks on it.
+        if self._save_thread is None:
+            self._save_thread = threading.Thread(target=self._drain_save_queue, daemon=True)
+            self._save_thread.start()
+        self._save_queue.put((filename, message))
+
+    def _drain_save_queue(self):
+        """Append queued messages as compact JSON lines to '<filename>.ndjson'."""
+        files = {}
+        while True:
+            batch = [self._save_queue.get()]
+            while True:
+                try:
+                    batch.append(self._save_queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            # A failed write only loses that message; the thread must keep
+            # draining or the queue would grow without bound.
+            for filename, message in batch:
+                try:
+                    file = files.get(filename)
+                    if file is None:
+                        file = files[filename] = open(f'{filename}.ndjson', 'ab', buffering=1 << 16)
+                    file.write(_dump_line(message))
+                except Exception:
+                    logger.exception(f'Failed to save message to {filename}.ndjson')
+
+            for filename, file in files.items():
+                try:
+                    file.flush()
+                except Exception:
+                    logger.exception(f'Failed to flush {filename}.ndjson')
+
+
+# Message name -> unbound handler, built once instead of per message
+MessageHandler._HANDLERS = {
+    'profile': MessageHandler._handle_profile,
+    'balances': MessageHandler._handle_balances,
+    'underlying-list': MessageHandler._handle_underlying_list,
+    'initialization-data': MessageHandler._handle_initialization_data,
+    'training-balance-reset': MessageHandler._handle_training_balance_reset,
+    "history-positions": MessageHandler._handle_position_history,
+    "digital-option-placed": MessageHandler._handle_digital_option_placed,
+    "position-changed": MessageHandler._handle_position_changed,
+    "option-opened": MessageHandler._handle_binary_option_opened,
+    "option-closed": MessageHandler._handle_binary_option_closed,
+}